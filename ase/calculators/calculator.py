@@ -165,27 +165,29 @@ def register_calculator_class(name, cls):
     names.sort()
 
 
+# Calculators whose class is not found in ase.calculators.<name>:
+calculator_locations = {'asap': ('asap3', 'EMT'),
+                        'gpaw': ('gpaw', 'GPAW'),
+                        'hotbit': ('hotbit', 'Calculator'),
+                        'vasp2': ('ase.calculators.vasp', 'Vasp2'),
+                        'ace': ('ase.calculators.acemolecule', 'ACE'),
+                        'Psi4': ('ase.calculators.psi4', 'Psi4')}
+
+
+def get_calculator_location(name):
+    """Return module name and class name of calculator."""
+    if name in calculator_locations:
+        return calculator_locations[name]
+    return 'ase.calculators.' + name, special.get(name, name.title())
+
+
 def get_calculator_class(name):
     """Return calculator class."""
-    if name == 'asap':
-        from asap3 import EMT as Calculator
-    elif name == 'gpaw':
-        from gpaw import GPAW as Calculator
-    elif name == 'hotbit':
-        from hotbit import Calculator
-    elif name == 'vasp2':
-        from ase.calculators.vasp import Vasp2 as Calculator
-    elif name == 'ace':
-        from ase.calculators.acemolecule import ACE as Calculator
-    elif name == 'Psi4':
-        from ase.calculators.psi4 import Psi4 as Calculator
-    elif name in external_calculators:
-        Calculator = external_calculators[name]
-    else:
-        classname = special.get(name, name.title())
-        module = __import__('ase.calculators.' + name, {}, None, [classname])
-        Calculator = getattr(module, classname)
-    return Calculator
+    if name in external_calculators and name not in calculator_locations:
+        return external_calculators[name]
+    modulename, classname = get_calculator_location(name)
+    module = __import__(modulename, {}, None, [classname])
+    return getattr(module, classname)
 
 
 def equal(a, b, tol=None):
@@ -12,6 +12,9 @@ becomes shorter, and the list of tests in other modules becomes
 longer."""
 
 
+from functools import lru_cache
+from itertools import chain
+import os
 from pathlib import Path
 import runpy
 from typing import Dict, Any, Generator
@@ -20,10 +23,38 @@ import unittest
 import ase.test as asetest
 
 
+def _scan_pyfiles(dirname):
+    # os.scandir() gets the file type from the directory listing itself,
+    # so we avoid a stat() call per entry as done by glob.
+    pyfiles = []
+    subdirs = []
+    for entry in os.scandir(dirname):
+        if entry.is_dir():
+            subdirs.append(entry.path)
+        elif entry.name.endswith('.py'):
+            pyfiles.append(entry.path)
+    return pyfiles, subdirs
+
+
+@lru_cache(maxsize=None)
+def _find_test_files(testdir):
+    testfiles, subdirs = _scan_pyfiles(testdir)
+    subdirtestfiles = chain.from_iterable(_scan_pyfiles(subdir)[0]
+                                          for subdir in subdirs)
+    # Tests in subdirectories come after the top-level ones:
+    testdir = Path(testdir)
+    return tuple(sorted(map(Path, chain(testfiles, subdirtestfiles)),
+                        key=lambda path: (path.parent != testdir, path)))
+
+
 class TestModule:
     ignorefiles = {'__init__.py', 'testsuite.py', 'newtestsuite.py',
                    'conftest.py'}
     testdir = Path(asetest.__file__).parent
+    # Tests failing to import one of these modules are skipped:
+    optional_modules = frozenset(['matplotlib', 'Scientific', 'lxml',
+                                  'Tkinter', 'flask', 'gpaw', 'GPAW',
+                                  'netCDF4', 'psycopg2', 'kimpy'])
 
     def __init__(self, testname: str):
         # Testname is e.g. "fio.dftb".
@@ -76,8 +107,7 @@ class TestModule:
     @classmethod
     def glob_all_test_modules(cls) -> "Generator[TestModule]":
         """Return a list of modules ['ase.test.xxx', 'ase.test.yyy', ...]."""
-        testfiles = sorted(cls.testdir.glob('*.py'))
-        testfiles += sorted(cls.testdir.glob('*/*.py'))
+        testfiles = _find_test_files(str(cls.testdir))
         # XXX Some tests were added at */*/*.py level, but the old test suite
         # never globbed so deep.  So these tests never ran.
         # We can/should rehabilitate them.
@@ -101,15 +131,14 @@ class TestModule:
 
     def define_script_test_function(self):
         module = self.module
+        optional_modules = self.optional_modules
 
         def test_script():
             try:
                 runpy.run_module(module, run_name='test')
             except ImportError as ex:
                 exmod = ex.args[0].split()[-1].replace("'", '').split('.')[0]
-                if exmod in ['matplotlib', 'Scientific', 'lxml', 'Tkinter',
-                             'flask', 'gpaw', 'GPAW', 'netCDF4', 'psycopg2',
-                             'kimpy']:
+                if exmod in optional_modules:
                     raise unittest.SkipTest('no {} module'.format(exmod))
                 else:
                     raise
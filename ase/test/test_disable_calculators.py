@@ -0,0 +1,26 @@
+import importlib
+import os
+import sys
+import unittest
+
+import pytest
+
+from ase.test.testsuite import disable_calculators
+
+
+def test_disable_unimported_calculator(monkeypatch):
+    if 'gromacs' in os.environ.get('ASE_TEST_CALCULATORS', '').split():
+        pytest.skip('gromacs calculator is enabled')
+
+    modulename = 'ase.calculators.gromacs'
+    monkeypatch.delitem(sys.modules, modulename, raising=False)
+    disable_calculators(['gromacs'])
+    assert modulename not in sys.modules
+
+    module = importlib.import_module(modulename)
+    with pytest.raises(unittest.SkipTest):
+        module.Gromacs()
+
+    # The original loader is put back once the module is loaded:
+    assert isinstance(module.__loader__, importlib.machinery.SourceFileLoader)
+    assert module.__spec__.loader is module.__loader__
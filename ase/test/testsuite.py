@@ -3,17 +3,23 @@ import sys
 import subprocess
 from contextlib import contextmanager
 import importlib
+import importlib.abc
 import unittest
 import warnings
 import argparse
 from multiprocessing import cpu_count
 
-from ase.calculators.calculator import names as calc_names, get_calculator_class
+from ase.calculators.calculator import (names as calc_names,
+                                       external_calculators,
+                                       calculator_locations,
+                                       get_calculator_location)
 from ase.cli.info import print_info
 from ase.cli.main import CLIError
 
 
 test_calculator_names = ['emt']
+# Calculators that are always enabled in the test suite:
+builtin_calculator_names = frozenset(['emt', 'lj', 'eam', 'morse', 'tip3p'])
 datafiles_directory = os.path.join(os.path.dirname(__file__), 'datafiles', '')
 
 
@@ -23,25 +29,91 @@ def require(calcname):
                                 .format(calcname))
 
 
+def disable_calculator_class(cls, name):
+    def mock_init(obj, *args, **kwargs):
+        raise unittest.SkipTest('use --calculators={0} to enable'
+                                .format(name))
+
+    def mock_del(obj):
+        pass
+
+    cls.__init__ = mock_init
+    cls.__del__ = mock_del
+
+
+class DisabledCalculatorFinder(importlib.abc.MetaPathFinder):
+    """Disable calculator classes when their modules get imported.
+
+    This way we do not need to import every calculator (and whatever
+    external package it depends on) just to disable it."""
+
+    def __init__(self):
+        self.calculators = {}  # module name -> [(calculator, class name)]
+
+    def add(self, modulename, name, classname):
+        self.calculators.setdefault(modulename, []).append((name, classname))
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in self.calculators:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None and spec.loader is not None:
+                break
+        else:
+            return None
+
+        spec.loader = DisablingLoader(spec.loader, self)
+        return spec
+
+
+class DisablingLoader(importlib.abc.Loader):
+    def __init__(self, loader, finder):
+        self.loader = loader
+        self.finder = finder
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Hide ourselves again once the module is loaded:
+        module.__loader__ = module.__spec__.loader = self.loader
+        self.loader.exec_module(module)
+        # Only forget about the calculators once the import succeeded,
+        # so that they are still disabled if a later import works:
+        calculators = self.finder.calculators.pop(module.__name__, [])
+        for name, classname in calculators:
+            cls = getattr(module, classname, None)
+            if cls is not None:
+                disable_calculator_class(cls, name)
+
+
+disabled_calculator_finder = DisabledCalculatorFinder()
+
+
 def disable_calculators(names):
     for name in names:
-        if name in ['emt', 'lj', 'eam', 'morse', 'tip3p']:
+        if name in builtin_calculator_names:
             continue
-        try:
-            cls = get_calculator_class(name)
-        except ImportError:
-            pass
+        if (name in external_calculators and
+            name not in calculator_locations):
+            disable_calculator_class(external_calculators[name], name)
+            continue
+
+        modulename, classname = get_calculator_location(name)
+        module = sys.modules.get(modulename)
+        if module is not None:
+            cls = getattr(module, classname, None)
+            if cls is not None:
+                disable_calculator_class(cls, name)
         else:
-            def get_mock_init(name):
-                def mock_init(obj, *args, **kwargs):
-                    raise unittest.SkipTest('use --calculators={0} to enable'
-                                            .format(name))
-                return mock_init
+            disabled_calculator_finder.add(modulename, name, classname)
 
-            def mock_del(obj):
-                pass
-            cls.__init__ = get_mock_init(name)
-            cls.__del__ = mock_del
+    if disabled_calculator_finder not in sys.meta_path:
+        sys.meta_path.insert(0, disabled_calculator_finder)
 
 
 def cli(command, calculator_name=None):
@@ -49,11 +121,9 @@ def cli(command, calculator_name=None):
         calculator_name not in test_calculator_names):
         return
     actual_command = ' '.join(command.split('\n')).strip()
-    proc = subprocess.Popen(actual_command,
-                            shell=True,
-                            stdout=subprocess.PIPE)
-    print(proc.stdout.read().decode())
-    proc.wait()
+    proc = subprocess.run(actual_command, shell=True,
+                          stdout=subprocess.PIPE)
+    print(proc.stdout.decode())
 
     if proc.returncode != 0:
         raise RuntimeError('Command "{}" exited with error code {}'
@@ -189,8 +259,9 @@ class CLICommand:
                 print(name)
             sys.exit(0)
 
+        known_calculators = set(calc_names)
         for calculator in calculators:
-            if calculator not in calc_names:
+            if calculator not in known_calculators:
                 sys.stderr.write('No calculator named "{}".\n'
                                  'Possible CALCULATORS are: '
                                  '{}.\n'.format(calculator,
@@ -211,6 +282,12 @@ class CLICommand:
         jobs = choose_how_many_workers(args.jobs)
         if jobs:
             add_args('--numprocesses={}'.format(jobs))
+            # Each worker should use one core.  Otherwise OpenMP/BLAS
+            # threads in every worker oversubscribe the machine.
+            # The workers inherit our environment:
+            for var in ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+                        'MKL_NUM_THREADS']:
+                os.environ.setdefault(var, '1')
 
         if args.tests:
             from ase.test.newtestsuite import TestModule